@@ -1,11 +1,17 @@
 
-import importlib
+import copy
+import functools
 
 from docutils import frontend, nodes, utils
 from docutils.parsers import rst
 from natcap.invest import set_locale
 from natcap.invest import spec_utils
 
+# building the default settings is slow, so do it once and reuse them
+DEFAULT_SETTINGS = frontend.OptionParser(
+    components=(rst.Parser,)).get_default_values()
+RST_PARSER = rst.Parser()
+
 
 def parse_rst(text):
     """Parse RST text into a list of docutils nodes.
@@ -17,13 +23,9 @@ def parse_rst(text):
     Returns:
         list[docutils.Node]
     """
-    doc = utils.new_document(
-        '',
-        settings=frontend.OptionParser(
-            components=(rst.Parser,)
-        ).get_default_values())
-    parser = rst.Parser()
-    parser.parse(text, doc)
+    # copy the settings so that one document can't affect the next
+    doc = utils.new_document('', settings=copy.copy(DEFAULT_SETTINGS))
+    RST_PARSER.parse(text, doc)
 
     # Skip the all-encompassing document node
     first_node = doc.next_node()
@@ -31,6 +33,25 @@ def parse_rst(text):
     return list(first_node.findall(descend=False, siblings=True))
 
 
+@functools.lru_cache(maxsize=None)
+def describe_arg(language, module_name, keys):
+    """Get the RST description of an arg, caching the result.
+
+    The same arg is often documented from several places in the user's
+    guide, so formatting it is only done once per language.
+
+    Args:
+        language (str): language code to install before formatting
+        module_name (str): name of an importable module with an ARGS_SPEC
+        keys (tuple[str]): series of keys to the nested arg to document
+
+    Returns:
+        RST-formatted description string
+    """
+    set_locale(language)
+    return spec_utils.describe_arg_from_name(module_name, *keys)
+
+
 def invest_spec(name, rawtext, text, lineno, inliner, options={}, content=[]):
     """Custom docutils role to generate InVEST model input docs from spec.
 
@@ -75,15 +96,13 @@ def invest_spec(name, rawtext, text, lineno, inliner, options={}, content=[]):
         module_name = f'{prefix}.{arguments[0]}'
     else:
         module_name = arguments[0]
-    keys = arguments[1].split('.')  # period-separated series of keys
+    # period-separated series of keys
+    keys = tuple(arguments[1].split('.'))
 
-    # access the 'language' setting, and install it
+    # access the 'language' setting, which is installed
     # before importing the desired invest module
     language = inliner.document.settings.env.app.config.language
-    set_locale(language if language else 'en')
-
-    spec_utils = importlib.import_module('natcap.invest.spec_utils')
-    rst = spec_utils.describe_arg_from_name(module_name, *keys)
+    rst = describe_arg(language if language else 'en', module_name, keys)
     return parse_rst(rst), []
 
 
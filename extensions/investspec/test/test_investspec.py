@@ -57,9 +57,21 @@ class TestInvestSpec(unittest.TestCase):
             None, None, 'test_module number_input', None, mock_inliner)
         self.assertEqual(len(nodes), 2)
         for node in nodes:
-            self.assertTrue(isinstance(node, Node))
+            self.assertIsInstance(node, Node)
         self.assertEqual(messages, [])
 
+    def test_describe_arg_cached(self):
+        """describe_arg should only format each arg once per language."""
+        investspec.describe_arg.cache_clear()
+        first = investspec.describe_arg(
+            'en', 'test_module.test_module', ('ratio_input',))
+        second = investspec.describe_arg(
+            'en', 'test_module.test_module', ('ratio_input',))
+        self.assertEqual(first, second)
+        cache_info = investspec.describe_arg.cache_info()
+        self.assertEqual(cache_info.misses, 1)
+        self.assertEqual(cache_info.hits, 1)
+
     def test_investspec_integration(self):
         """Built html should contain generated arg documentation."""
         subprocess.run([
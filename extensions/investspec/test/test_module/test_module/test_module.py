@@ -1,6 +1,7 @@
 import pint
 
-ureg = pint.UnitRegistry()
+# use pint's on-disk cache so the registry isn't re-parsed on every run
+ureg = pint.UnitRegistry(cache_folder=':auto:')
 ureg.define('none = []')
 
 ARGS_SPEC = {